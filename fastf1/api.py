@@ -20,6 +20,7 @@ A collection of functions to interface with the F1 web api.
    session_status_data
    driver_info
    weather_data
+   prefetch_pages
    fetch_page
    parse
 
@@ -32,20 +33,30 @@ import logging
 import os
 import pickle
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 import requests
 import requests_cache
 
-from fastf1.utils import recursive_dict_get, to_timedelta, to_datetime
+try:
+    import deflate  # libdeflate bindings; much faster raw DEFLATE decompression
+except ImportError:
+    deflate = None
+
+try:
+    from orjson import loads as _json_loads  # much faster on numeric-heavy payloads
+except ImportError:
+    _json_loads = json.loads
+
+from fastf1.utils import recursive_dict_get, to_timedelta
 
 
 base_url = 'https://livetiming.formula1.com'
 
 headers = {
   'Host': 'livetiming.formula1.com',
-  'Connection': 'close',
   'TE': 'identity',
   'User-Agent': 'BestHTTP',
   'Accept-Encoding': 'gzip, identity',
@@ -109,11 +120,12 @@ class Cache:
     on FastF1.
     """
     _CACHE_DIR = ''
-    _API_CORE_VERSION = 4  # version of the api parser code (unrelated to release version number)
+    _API_CORE_VERSION = 5  # version of the api parser code (unrelated to release version number)
     _IGNORE_VERSION = False
     _FORCE_RENEW = False
 
     _requests_session = None
+    _plain_requests_session = None
     _has_been_warned = False  # flag to ensure that warning about disabled cache is logged once only
     _tmp_disabled = False
 
@@ -156,7 +168,7 @@ class Cache:
         """
         cls._show_not_enabled_warning()
         if (cls._requests_session is None) or cls._tmp_disabled:
-            return requests.get(*args, **kwargs)
+            return cls._get_plain_session().get(*args, **kwargs)
         return cls._requests_session.get(*args, **kwargs)
 
     @classmethod
@@ -170,9 +182,21 @@ class Cache:
         """
         cls._show_not_enabled_warning()
         if (cls._requests_session is None) or cls._tmp_disabled:
-            return requests.post(*args, **kwargs)
+            return cls._get_plain_session().post(*args, **kwargs)
         return cls._requests_session.post(*args, **kwargs)
 
+    @classmethod
+    def _get_plain_session(cls):
+        # shared plain session for requests without caching; reusing one
+        # session enables http keep-alive, so repeated requests skip the
+        # tcp/tls handshake
+        if cls._plain_requests_session is None:
+            cls._plain_requests_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=16,
+                                                    max_retries=3)
+            cls._plain_requests_session.mount('https://', adapter)
+        return cls._plain_requests_session
+
     @classmethod
     def clear_cache(cls, cache_dir, deep=False):
         """Clear all cached data.
@@ -279,6 +303,50 @@ class Cache:
 
         return _cached_api_request
 
+    @classmethod
+    def fetch_page_wrapper(cls, func):
+        """Wrapper function for adding caching of parsed api responses to
+        :func:`fetch_page`.
+
+        The parsed response for each requested page is pickled on disk,
+        keyed by api path and page name. This way the cost for downloading
+        and parsing a page is only ever paid once, even if multiple api
+        functions request the same page or the parsing code is changed
+        (which invalidates the stage 2 cache but not the raw response).
+
+        Args:
+            func: function to be wrapped
+
+        Returns:
+            The wrapped function
+        """
+        @functools.wraps(func)
+        def _cached_fetch_page(path, name):
+            if cls._CACHE_DIR and not cls._tmp_disabled:
+                # caching is enabled; cache files are suffixed with '_raw' to
+                # prevent name collisions with the stage 2 cache files
+                cache_file_path = cls._get_cache_file_path(path, name + '_raw')
+
+                if os.path.isfile(cache_file_path):
+                    try:
+                        cached = pickle.load(open(cache_file_path, 'rb'))
+                    except:  # noqa: E722 (bare except)
+                        cached = None
+
+                    if cached is not None and cls._data_ok_for_use(cached):
+                        logging.info(f"Using cached response for {name}")
+                        return cached['data']
+
+                data = func(path, name)
+                if data is not None:
+                    cls._write_cache(data, cache_file_path)
+                return data
+
+            else:  # cache was not enabled
+                return func(path, name)
+
+        return _cached_fetch_page
+
     @classmethod
     def _get_cache_file_path(cls, api_path, name):
         # extend the cache dir path using the api path and a file name
@@ -402,6 +470,16 @@ def make_path(wname, wdate, sname, sdate):
     return '/static/' + smooth_operator.replace(' ', '_')
 
 
+@functools.lru_cache(maxsize=8192)
+def _cached_timedelta(x):
+    """Memoized version of :func:`fastf1.utils.to_timedelta`.
+
+    The time strings in the timing data repeat often (sector times have
+    limited precision and are similar for all drivers), so most calls become
+    a simple dict lookup."""
+    return to_timedelta(x)
+
+
 # define all empty columns for timing data
 EMPTY_LAPS = {'Time': pd.NaT, 'Driver': str(), 'LapTime': pd.NaT,
               'NumberOfLaps': np.NaN, 'NumberOfPitStops': np.NaN,
@@ -548,14 +626,13 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
     # this is needed so we can work with a more efficient "look ahead" on the main pass
     # example: we can have 'PitOut' 0.01s before a new lap starts, but 'PitOut' belongs to the new lap, not the old one
 
-    lapcnt = 0  # we're keeping two separate lap counts because sometimes the api has a non existent lap too much...
-    api_lapcnt = 0  # ...at the beginning; we can correct that though;
-    # api_lapcnt does not count backwards even if the source data does
+    api_lapcnt = 0  # api_lapcnt does not count backwards even if the source data does
     in_past = False  # flag for when the data went back in time
     out_of_pit = False  # flag set to true when driver drives out FOR THE FIRST TIME; stays true from then on
 
-    # entries are prefilled with empty values and only overwritten if they exist in the response line
-    drv_data = {key: [val, ] for key, val in empty_vals.items()}
+    # the first pass only collects the session time at which each lap ended; all columns are then allocated once at
+    # their final size instead of appending one row per lap
+    lap_times = list()
 
     for time, resp in driver_raw:
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
@@ -564,7 +641,7 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
 
         if 'NumberOfLaps' in resp and ((prev_lapcnt := resp['NumberOfLaps']) < api_lapcnt):
             logging.warning(f"Driver {drv: >2}: Ignoring late data for a previously processed lap."
-                            f"The data may contain errors (previous: {prev_lapcnt}; current {lapcnt})")
+                            f"The data may contain errors (previous: {prev_lapcnt}; current {len(lap_times)})")
             in_past = True
             continue
 
@@ -574,16 +651,18 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         if ('InPit' in resp) and (resp['InPit'] is False):
             out_of_pit = True  # drove out of the pits for the first time
 
-        # new lap; create next row
+        # new lap
         if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if out_of_pit:
-                drv_data['Time'][lapcnt] = to_timedelta(time)
-                lapcnt += 1
-                # append a new empty row; last row may not be populated (depending on session) and may be removed later
-                for key, val in empty_vals.items():
-                    drv_data[key].append(val)
+                lap_times.append(_cached_timedelta(time))
+
+    # entries are prefilled with empty values and only overwritten if they exist in the response line
+    # one row per detected lap plus one trailing row; the last row may not be populated (depending on session)
+    # and may be removed later
+    drv_data = {key: [val, ] * (len(lap_times) + 1) for key, val in empty_vals.items()}
+    drv_data['Time'][:len(lap_times)] = lap_times
 
     # now, do the main pass where all the other data is actually filled in
     # same counters and flags as before, reset them
@@ -596,6 +675,15 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
 
     pitstops = -1  # start with -1 because first is out lap, needs to be zero after that
 
+    # bind the most frequently accessed columns and the comparison constants
+    # to locals; the chained subscripts would otherwise be re-evaluated for
+    # every response entry
+    col_time = drv_data['Time']
+    col_pit_in = drv_data['PitInTime']
+    col_pit_out = drv_data['PitOutTime']
+    five_minutes = pd.Timedelta(5, 'min')
+    five_seconds = pd.Timedelta(5, 's')
+
     # iterate through the data; new lap triggers next row in data
     for time, resp in driver_raw:
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
@@ -605,17 +693,19 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             in_past = True
             continue
 
-        if (lapcnt == 0) and ((drv_data['Time'][lapcnt] - to_timedelta(time)) > pd.Timedelta(5, 'min')):
+        entry_time = _cached_timedelta(time)
+
+        if (lapcnt == 0) and ((col_time[lapcnt] - entry_time) > five_minutes):
             # ignore any data which arrives more than 5 minutes before the end of the first lap, except 'PitOut'
             if ('InPit' in resp) and (resp['InPit'] is False):
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)
+                col_pit_out[lapcnt] = entry_time
                 pitstops = 0  # special here, can be multiple times for no reason therefore set zero instead of +=1
             continue
 
         # values which are up to five seconds late are still counted towards the previous lap
         # (sector times, speed traps and lap times)
         lap_offset = 0
-        if (lapcnt > 0) and (to_timedelta(time) - drv_data['Time'][lapcnt - 1] < pd.Timedelta(5, 's')):
+        if (lapcnt > 0) and (entry_time - col_time[lapcnt - 1] < five_seconds):
             lap_offset = 1
 
         if 'Sectors' in resp and isinstance(resp['Sectors'], dict):
@@ -624,13 +714,13 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
                                       ('1', 'Sector2Time', 'Sector2SessionTime'),
                                       ('2', 'Sector3Time', 'Sector3SessionTime')):
                 if val := recursive_dict_get(resp, 'Sectors', sn, 'Value'):
-                    drv_data[sector][lapcnt - lap_offset] = to_timedelta(val)
-                    drv_data[sesst][lapcnt - lap_offset] = to_timedelta(time)
+                    drv_data[sector][lapcnt - lap_offset] = _cached_timedelta(val)
+                    drv_data[sesst][lapcnt - lap_offset] = entry_time
 
         if val := recursive_dict_get(resp, 'LastLapTime', 'Value'):
             # if 'LastLapTime' is received less than five seconds after the start of a new lap, it is still added
             # to the last lap
-            val = to_timedelta(val)
+            val = _cached_timedelta(val)
             if val.total_seconds() < 150:
                 # laps which are longer than 150 seconds are ignored; usually this is the case between Q1, Q2 and Q3
                 # because all three qualifying sessions are one session here. Those timestamps are often wrong and
@@ -647,25 +737,25 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             # 'InPit': True is received once when entering pits, False is received once when leaving
             if resp['InPit'] is True:
                 if pitstops >= 0:
-                    drv_data['PitInTime'][lapcnt] = to_timedelta(time)
+                    col_pit_in[lapcnt] = entry_time
             elif ((('NumberOfLaps' in resp) and resp['NumberOfLaps'] > api_lapcnt)
-                  or (drv_data['Time'][lapcnt] - to_timedelta(time)) < pd.Timedelta(5, 's')):
+                  or (col_time[lapcnt] - entry_time) < five_seconds):
                 # same response line as beginning of next lap or beginning of next lap less than 5 seconds away
-                drv_data['PitOutTime'][lapcnt+1] = to_timedelta(time)  # add to next lap
+                col_pit_out[lapcnt+1] = entry_time  # add to next lap
                 pitstops += 1
             else:
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)  # add to current lap
+                col_pit_out[lapcnt] = entry_time  # add to current lap
                 pitstops += 1
 
         if val := recursive_dict_get(resp, 'BestLapTime', 'Value'):
-            personal_best_lap_time = to_timedelta(val)
+            personal_best_lap_time = _cached_timedelta(val)
 
         # new lap; create next row
         if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if pitstops >= 0:
-                drv_data['Time'][lapcnt] = to_timedelta(time)
+                col_time[lapcnt] = entry_time
                 drv_data['NumberOfLaps'][lapcnt] = lapcnt + 1  # don't use F1's lap count; ours is better
                 drv_data['NumberOfPitStops'][lapcnt] = pitstops
                 drv_data['Driver'][lapcnt] = drv
@@ -795,23 +885,31 @@ def _stream_data_driver(driver_raw, empty_vals, drv):
     drv_data = {key: [val, ] for key, val in empty_vals.items()}
     i = 0
 
+    # bind the columns to locals; this avoids re-evaluating the chained
+    # subscripts for every response entry
+    col_time = drv_data['Time']
+    col_driver = drv_data['Driver']
+    col_position = drv_data['Position']
+    col_gap = drv_data['GapToLeader']
+    col_interval = drv_data['IntervalToPositionAhead']
+
     # iterate through the data; timestamp + any of the values triggers new row in data
     for time, resp in driver_raw:
         new_entry = False
         if val := recursive_dict_get(resp, 'Position'):
-            drv_data['Position'][i] = int(val)
+            col_position[i] = int(val)
             new_entry = True
         if val := recursive_dict_get(resp, 'GapToLeader'):
-            drv_data['GapToLeader'][i] = val
+            col_gap[i] = val
             new_entry = True
         if val := recursive_dict_get(resp, 'IntervalToPositionAhead', 'Value'):
-            drv_data['IntervalToPositionAhead'][i] = val
+            col_interval[i] = val
             new_entry = True
 
         # at least one value was present, create next row
         if new_entry:
-            drv_data['Time'][i] = to_timedelta(time)
-            drv_data['Driver'][i] = drv
+            col_time[i] = _cached_timedelta(time)
+            col_driver[i] = drv
             i += 1
 
             # create next row of data from the last values; there will always be one row too much at the end which is
@@ -878,31 +976,34 @@ def timing_app_data(path, response=None, livedata=None):
         if (len(entry) < 2) or 'Lines' not in entry[1]:
             continue
 
-        time = to_timedelta(entry[0])
+        time = _cached_timedelta(entry[0])
         row = entry[1]
         for driver_number in row['Lines']:
-            if update := recursive_dict_get(row, 'Lines', driver_number, 'Stints'):
-                for stint_number, stint in enumerate(update):
-                    if isinstance(update, dict):
-                        stint_number = int(stint)
-                        stint = update[stint]
-                    for key in data:
-                        if key in stint:
-                            val = stint[key]
-                            if key == 'LapTime':
-                                val = to_timedelta(val)
-                            elif key == 'New':
-                                val = True if val == 'true' else False
-                            data[key].append(val)
-                        else:
-                            data[key].append(None)
-                    for key in stint:
-                        if key not in data:
-                            logging.debug(f"Found unknown key in timing app data: {key}")
-
-                    data['Time'][-1] = time
-                    data['Driver'][-1] = driver_number
-                    data['Stint'][-1] = stint_number
+            update = recursive_dict_get(row, 'Lines', driver_number, 'Stints')
+            if not update:
+                continue
+
+            # normalize the two response formats up front: stints are
+            # either a list or a dict indexed by stint number
+            if isinstance(update, dict):
+                stints = ((int(num), stint) for num, stint in update.items())
+            else:
+                stints = enumerate(update)
+
+            for stint_number, stint in stints:
+                # one dict lookup per column; most stints only contain a
+                # few of the columns and missing ones simply become None
+                for key, col in data.items():
+                    col.append(stint.get(key))
+
+                if (val := stint.get('LapTime')) is not None:
+                    data['LapTime'][-1] = _cached_timedelta(val)
+                if (val := stint.get('New')) is not None:
+                    data['New'][-1] = (val == 'true')
+
+                data['Time'][-1] = time
+                data['Driver'][-1] = driver_number
+                data['Stint'][-1] = stint_number
 
     return pd.DataFrame(data)
 
@@ -963,13 +1064,11 @@ def car_data(path, response=None, livedata=None):
 
     logging.info("Parsing car data...")
 
-    channels = {'0': 'RPM', '2': 'Speed', '3': 'nGear', '4': 'Throttle', '5': 'Brake', '45': 'DRS'}
-    num_channels = ['RPM', 'Speed', 'nGear', 'Throttle', 'DRS']
+    num_channels = ['RPM', 'Speed', 'nGear', 'Throttle']
     bool_channels = ['Brake']
-    columns = ['Time', 'Date', 'RPM', 'Speed', 'nGear', 'Throttle', 'Brake', 'DRS', 'Source']
     ts_length = 12  # length of timestamp: len('00:00:00:000')
 
-    data = dict()
+    data = dict()  # driver -> list of sample tuples (one per row)
     decode_error_count = 0
 
     for record in response:
@@ -978,26 +1077,35 @@ def car_data(path, response=None, livedata=None):
                 time = to_timedelta(record[0])
                 jrecord = parse(record[1], zipped=True)
             else:
-                time = to_timedelta(record[:ts_length])
+                # records from fetch_page are raw bytes; only the ascii
+                # clock prefix needs decoding, the compressed payload is
+                # parsed from bytes directly
+                if isinstance(record, bytes):
+                    time = to_timedelta(record[:ts_length].decode('ascii'))
+                else:
+                    time = to_timedelta(record[:ts_length])
                 jrecord = parse(record[ts_length:], zipped=True)
 
             for entry in jrecord['Entries']:
                 # date format is '2020-08-08T09:45:03.0619797Z' with a varying number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len 26 with zeroes if shorter
-                date = to_datetime(entry['Utc'])
+                # the string is kept as is here; the full date column is converted in one vectorized pass later
+                date = entry['Utc']
+
+                for driver, car in entry['Cars'].items():
+                    # one row per driver and sample; missing channel values
+                    # default to zero ('or 0' also maps empty strings to zero)
+                    channel_data = car.get('Channels', {})
+                    row = (time, date,
+                           int(channel_data.get('0') or 0),   # RPM
+                           int(channel_data.get('2') or 0),   # Speed
+                           int(channel_data.get('3') or 0),   # nGear
+                           int(channel_data.get('4') or 0),   # Throttle
+                           int(channel_data.get('5') or 0),   # Brake
+                           int(channel_data.get('45') or 0))  # DRS
 
-                for driver in entry['Cars']:
                     if driver not in data:
-                        data[driver] = {col: list() for col in columns}
-
-                    data[driver]['Time'].append(time)
-                    data[driver]['Date'].append(date)
-
-                    for n in channels:
-                        val = recursive_dict_get(entry, 'Cars', driver, 'Channels', n)
-                        if not val:
-                            val = 0
-                        data[driver][channels[n]].append(int(val))
+                        data[driver] = list()
+                    data[driver].append(row)
 
         except Exception:
             # too risky to specify an exception: unexpected invalid data!
@@ -1011,11 +1119,30 @@ def car_data(path, response=None, livedata=None):
     # create one dataframe per driver and check for the longest dataframe
     most_complete_ref = None
     for driver in data:
-        # add source reference for each sample
-        data[driver]['Source'] = ['car', ] * len(data[driver]['Date'])
-        data[driver] = pd.DataFrame(data[driver])  # convert dict to dataframe
+        # transpose the collected rows once and build every numeric column
+        # as a typed array directly; this skips dtype inference over python
+        # objects in the DataFrame constructor and avoids object columns as
+        # an intermediate
+        time_col, date_col, rpm, speed, gear, throttle, brake, drs \
+            = zip(*data[driver])
+        n = len(time_col)
+        data[driver] = pd.DataFrame({
+            'Time': list(time_col),
+            # batched conversion of the date strings; repeated strings
+            # (samples share timestamps) only need to be parsed once this way
+            'Date': pd.to_datetime(date_col, cache=True).tz_localize(None),
+            'RPM': np.fromiter(rpm, np.int64, n),
+            'Speed': np.fromiter(speed, np.int64, n),
+            'nGear': np.fromiter(gear, np.int64, n),
+            'Throttle': np.fromiter(throttle, np.int64, n),
+            'Brake': np.fromiter(brake, np.int64, n),
+            # DRS is a small status enum (values 0-14); int8 is sufficient
+            # and noticeably cheaper for the high sample count of car data
+            'DRS': np.fromiter(drs, np.int8, n),
+            'Source': 'car',  # source reference for each sample
+        })
         # check length of dataframe; sometimes there can be missing data
-        if most_complete_ref is None or len(data[driver]['Date']) > len(most_complete_ref):
+        if most_complete_ref is None or n > len(most_complete_ref):
             most_complete_ref = data[driver]['Date']
 
     for driver in data:
@@ -1053,6 +1180,10 @@ def car_data(path, response=None, livedata=None):
             .fillna(value=False, inplace=False)\
             .astype('bool')
 
+        data[driver]['DRS'] = data[driver]['DRS'] \
+            .fillna(value=0, inplace=False) \
+            .astype('int8')
+
     return data
 
 
@@ -1104,9 +1235,9 @@ def position_data(path, response=None, livedata=None):
         return {}
 
     ts_length = 12  # length of timestamp: len('00:00:00:000')
-    columns = ['Time', 'Date', 'Status', 'X', 'Y', 'Z', 'Source']
+    columns = ['Time', 'Date', 'Status', 'X', 'Y', 'Z']
 
-    data = dict()
+    data = dict()  # driver -> list of sample tuples (one per row)
     decode_error_count = 0
 
     for record in response:
@@ -1115,29 +1246,32 @@ def position_data(path, response=None, livedata=None):
                 time = record[0]
                 jrecord = parse(record[1], zipped=True)
             else:
-                time = to_timedelta(record[:ts_length])
+                # records from fetch_page are raw bytes; only the ascii
+                # clock prefix needs decoding, the compressed payload is
+                # parsed from bytes directly
+                if isinstance(record, bytes):
+                    time = to_timedelta(record[:ts_length].decode('ascii'))
+                else:
+                    time = to_timedelta(record[:ts_length])
                 jrecord = parse(record[ts_length:], zipped=True)
 
             for sample in jrecord['Position']:
                 # date format is '2020-08-08T09:45:03.0619797Z' with a varying number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len 26 with zeroes if shorter
-                date = to_datetime(sample['Timestamp'])
-
-                for driver in sample['Entries']:
-                    if driver not in data:
-                        data[driver] = {col: list() for col in columns}
+                # the string is kept as is here; the full date column is converted in one vectorized pass later
+                date = sample['Timestamp']
 
-                    data[driver]['Time'].append(time)
-                    data[driver]['Date'].append(date)
-
-                    for coord in ['X', 'Y', 'Z']:
-                        data[driver][coord].append(recursive_dict_get(sample, 'Entries', driver, coord))
-
-                    status = recursive_dict_get(sample, 'Entries', driver, 'Status')
+                for driver, pos in sample['Entries'].items():
+                    status = pos.get('Status')
                     if str(status).isdigit():
                         # Fallback on older api status mapping and convert
                         status = 'OffTrack' if int(status) else 'OnTrack'
-                    data[driver]['Status'].append(status)
+
+                    row = (time, date, status,
+                           pos.get('X'), pos.get('Y'), pos.get('Z'))
+
+                    if driver not in data:
+                        data[driver] = list()
+                    data[driver].append(row)
 
         except Exception:
             # too risky to specify an exception: unexpected invalid data!
@@ -1151,8 +1285,15 @@ def position_data(path, response=None, livedata=None):
     # create one dataframe per driver and check for the longest dataframe
     most_complete_ref = None
     for driver in data:
-        data[driver]['Source'] = ['pos', ] * len(data[driver]['Date'])  # add source reference for each sample
-        data[driver] = pd.DataFrame(data[driver])  # convert dict to dataframe
+        # convert the list of row tuples to a dataframe in one go and add a
+        # source reference for each sample
+        data[driver] = pd.DataFrame(data[driver], columns=columns)
+        data[driver]['Source'] = 'pos'
+        # batched conversion of the date strings; repeated strings (samples
+        # share timestamps) only need to be parsed once this way
+        data[driver]['Date'] = pd.to_datetime(
+            data[driver]['Date'], cache=True
+        ).dt.tz_localize(None)
         # check length of dataframe; sometimes there can be missing data
         if most_complete_ref is None or len(data[driver]['Date']) > len(most_complete_ref):
             most_complete_ref = data[driver]['Date']
@@ -1350,8 +1491,10 @@ def driver_info(path, response=None, livedata=None):
     except (IndexError, TypeError):
         return dict()
     else:
-        for drv in drv_info:
-            drv_info[drv].update(team_info.get(drv, {}))
+        # merge into new dicts; the response may be shared (memoized), so it
+        # must not be modified in place
+        drv_info = {drv: {**info, **team_info.get(drv, {})}
+                    for drv, info in drv_info.items()}
         if not len(drv_info) or not isinstance(drv_info, dict):
             return dict()
         if 'RacingNumber' not in list(drv_info.values())[0]:
@@ -1434,10 +1577,43 @@ def weather_data(path, response=None, livedata=None):
     return data
 
 
+def prefetch_pages(path, names=('timing_data', 'timing_app_data',
+                                'track_status', 'session_status',
+                                'car_data', 'position', 'weather_data',
+                                'driver_list')):
+    """Fetch multiple api pages concurrently.
+
+    Each individual fetch is network-bound, so downloading the pages of a
+    session in parallel collapses the total wall time to roughly that of the
+    largest page. The responses are cached as usual (see :func:`fetch_page`),
+    so api functions that are called afterwards find warm cache entries and
+    do not fetch again.
+
+    Args:
+        path (str): api path base string (usually ``Session.api_path``)
+        names (iterable): page names to fetch (see :attr:`pages` for all
+            known pages); defaults to all pages used when loading a session
+
+    Returns:
+        A dictionary that maps each page name to the parsed response for
+        that page (or to None if the request failed).
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {name: executor.submit(fetch_page, path, name)
+                   for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
+
+@Cache.fetch_page_wrapper
 def fetch_page(path, name):
     """Fetch data from the formula1 livetiming web api, given url base path and page name. An attempt
     to parse json or decode known messages is made.
 
+    The parsed response is cached on disk if the cache is enabled, so repeated
+    calls for the same page only pay the download and parsing cost once.
+    Additionally, a small number of responses is memoized in process so that
+    repeated requests for the same page do not even hit the disk cache.
+
     Args:
         path (str): api path base string (usually ``Session.api_path``)
         name (str): page name (see :attr:`pages` for all known pages)
@@ -1449,36 +1625,111 @@ def fetch_page(path, name):
         - None if request failed
 
     """
+    try:
+        if Cache._tmp_disabled:
+            # bypass the in-process memoization too while the cache is
+            # disabled
+            return _fetch_page.__wrapped__(path, name)
+        return _fetch_page(path, name)
+    except _RequestFailedError:
+        return None
+
+
+class _RequestFailedError(Exception):
+    """Raised internally by :func:`_fetch_page` when a request does not
+    succeed. Raising instead of returning ``None`` ensures that failures are
+    not memoized by the lru cache, so a later call can retry the request.
+    :func:`fetch_page` translates this back into its ``None`` return value."""
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_page(path, name):
     page = pages[name]
     is_stream = 'jsonStream' in page
     is_z = '.z.' in page
-    r = Cache.requests_get(base_url + path + pages[name], headers=headers)
-    if r.status_code == 200:
-        raw = r.content.decode('utf-8-sig')
-        if is_stream:
-            records = raw.split('\r\n')[:-1]  # last split is empty
-            if name in ('position', 'car_data'):
-                # Special case to improve memory efficiency
-                return records
-            else:
-                decode_error_count = 0
-                tl = 12  # length of timestamp: len('00:00:00:000')
-                ret = list()
-                for e in records:
-                    try:
-                        ret.append([e[:tl], parse(e[tl:], zipped=is_z)])
-                    except json.JSONDecodeError:
-                        decode_error_count += 1
-                        continue
-                if decode_error_count > 0:
-                    logging.warning(f"Failed to decode {decode_error_count}"
-                                    f" messages ({len(records)} messages "
-                                    f"total)")
-                return ret
+    r = Cache.requests_get(base_url + path + pages[name], headers=headers,
+                           stream=is_stream)
+    if r.status_code != 200:
+        raise _RequestFailedError
+    if is_stream:
+        # process the response line by line while it is received; this avoids
+        # materializing the full decoded body and the list of raw records in
+        # addition to the parsed result ('.z.' streams are multiple MB)
+        # records are delimited by '\r\n'; the delimiter needs to be given
+        # explicitly as single '\r' or '\n' characters can occur within a
+        # record; empty lines need to be skipped as iter_lines produces
+        # spurious empty strings when a chunk boundary coincides with the
+        # delimiter
+        if name in ('position', 'car_data'):
+            # Special case to improve memory efficiency: the records are kept
+            # as raw bytes; decoding the multi-MB body here would only create
+            # an additional full copy as the consumers decode nothing but the
+            # 12-byte clock prefix and parse the compressed payload from
+            # bytes directly
+            ret = [line for line in r.iter_lines(delimiter=b'\r\n') if line]
+            if ret and ret[0][:3] == b'\xef\xbb\xbf':
+                ret[0] = ret[0][3:]  # strip the byte order mark
+            return ret
         else:
-            return parse(raw, is_z)
+            records = 0
+            decode_error_count = 0
+            tl = 12  # length of timestamp: len('00:00:00:000')
+            ret = list()
+            for line in r.iter_lines(delimiter=b'\r\n'):
+                if not line:
+                    continue
+                records += 1
+                e = line.decode('utf-8-sig')
+                try:
+                    ret.append([e[:tl], parse(e[tl:], zipped=is_z)])
+                except json.JSONDecodeError:
+                    decode_error_count += 1
+                    continue
+            if decode_error_count > 0:
+                logging.warning(f"Failed to decode {decode_error_count}"
+                                f" messages ({records} messages "
+                                f"total)")
+            return ret
     else:
-        return None
+        return parse(r.content.decode('utf-8-sig'), is_z)
+
+
+def _inflate(data):
+    """Decompress a raw DEFLATE stream as contained in '.z.' data.
+
+    Uses libdeflate (through the optional 'deflate' package) if it is
+    installed as it is considerably faster than zlib for single-buffer
+    decompression. Falls back to zlib else.
+    """
+    if deflate is None:
+        return zlib.decompress(data, -zlib.MAX_WBITS)
+
+    # libdeflate requires an upper bound for the size of the decompressed
+    # data; start with a generous estimate and double it if it turns out to
+    # be insufficient; give up at some point and fall back to zlib, in case
+    # the error is caused by invalid data instead
+    size = max(16 * len(data), 2 ** 16)
+    while size <= 2 ** 26:
+        try:
+            return deflate.deflate_decompress(data, size)
+        except deflate.DeflateError:
+            size *= 2
+    return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_zipped(text):
+    """Decode and parse a single base64 + DEFLATE compressed payload.
+
+    Identical zero-delta packets repeat regularly in the '.z.' streams;
+    memoizing on the compressed text avoids decompressing and parsing the
+    same packet again."""
+    data = _inflate(base64.b64decode(text))
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]  # strip a byte order mark if present
+    # the decompressed payload is always json; both orjson and the stdlib
+    # json parse bytes directly, so no intermediate decode is needed
+    return _json_loads(data)
 
 
 def parse(text, zipped=False):
@@ -1488,7 +1739,8 @@ def parse(text, zipped=False):
     Timestamps and data need to be separated before and only the data must be passed as a string to be parsed.
 
     Args:
-        text (str): The string which should be parsed
+        text (str or bytes): The string which should be parsed; '.z' data
+            may be passed as bytes to skip decoding the full payload
         zipped (bool): Whether or not the text is compressed. This is the case for '.z' data (e.g. position data=)
 
     Returns:
@@ -1496,13 +1748,20 @@ def parse(text, zipped=False):
             - a dictionary created as a result of loading json data
             - a string
     """
-    if text[0] == '{':
-        return json.loads(text)
-    if text[0] == '"':
-        text = text.strip('"')
+    if isinstance(text, bytes):
+        brace, quote = b'{', b'"'
+    else:
+        brace, quote = '{', '"'
+    if text[0:1] == brace:
+        return _json_loads(text)
+    if text[0:1] == quote:
+        text = text.strip(quote)
     if zipped:
-        text = zlib.decompress(base64.b64decode(text), -zlib.MAX_WBITS)
-        return parse(text.decode('utf-8-sig'))
+        if len(text) < 8:
+            # too short to be a valid base64-encoded DEFLATE stream; treat
+            # as an empty update without paying the decompression setup cost
+            return {}
+        return _parse_zipped(text)
     logging.warning("Couldn't parse text")
     return text
 
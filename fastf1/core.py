@@ -347,7 +347,9 @@ class Telemetry(pd.DataFrame):
             d = self.merge_channels(edges)
 
         else:
-            d = self.copy()  # TODO no copy?
+            # no copy required; only the mask is computed on this reference
+            # and slice_by_mask copies the selected rows itself
+            d = self
 
         sel = ((d['SessionTime'] <= end_time) & (d['SessionTime'] >= start_time))
         if np.any(sel):
@@ -1127,7 +1129,7 @@ class Session:
                 self._session_start_time = session_status['Time'][i]
                 break
         self._session_status = pd.DataFrame(session_status)
-        df = None
+        frames = list()
 
         drivers = self.drivers
         if not drivers:
@@ -1179,25 +1181,24 @@ class Session:
             else:
                 result = pd.merge_asof(d1, d2, on='Time', by='Driver')
 
-            # calculate lap start time by setting it to the 'Time' of the previous lap
-            laps_start_time = list(result['Time'])[:-1]
+            # calculate lap start time by setting it to the 'Time' of the
+            # previous lap; shift is positional and therefore safe even if
+            # the index of this frame is not contiguous
+            result.loc[:, 'LapStartTime'] = result['Time'].shift(1)
             if self.name == 'Race':
                 # assumption that the first lap started when the session was started can only be made for the race
-                laps_start_time.insert(0, self.session_start_time)
-            else:
-                laps_start_time.insert(0, pd.NaT)
-            result.loc[:, 'LapStartTime'] = pd.Series(
-                laps_start_time, dtype='timedelta64[ns]'
-            )
+                result.iloc[0, result.columns.get_loc('LapStartTime')] \
+                    = self.session_start_time
 
             # set missing lap start times to pit out time where possible
             mask = pd.isna(result['LapStartTime']) & (~pd.isna(result['PitOutTime']))
             result.loc[mask, 'LapStartTime'] = result.loc[mask, 'PitOutTime']
 
-            # create total laps counter
-            for npit in result['NumberOfPitStops'].unique():
-                sel = result['NumberOfPitStops'] == npit
-                result.loc[sel, 'TotalLaps'] += np.arange(0, sel.sum()) + 1
+            # create total laps counter; tyre age increases by one for every
+            # lap within a stint (single vectorized pass instead of one
+            # masked assignment per stint)
+            result.loc[:, 'TotalLaps'] \
+                += result.groupby('NumberOfPitStops').cumcount() + 1
 
             # check if there is another lap during which the session was aborted
             # but which is not in the data
@@ -1237,14 +1238,18 @@ class Session:
                         'New': [result['New'].iloc[-1]],
                     })
                     if not only_one_lap:
-                        result = result.append(new_last).reset_index(drop=True)
+                        result = pd.concat([result, new_last])\
+                            .reset_index(drop=True)
                     else:
                         result = new_last
 
-            df = pd.concat([df, result], sort=False)
-        if df is None:
+            frames.append(result)
+        if not frames:
             raise NoLapDataError
-        laps = df.reset_index(drop=True)  # noqa: F821
+        # concatenate all drivers' frames at once; concatenating inside the
+        # loop would copy the accumulated data once per driver
+        laps = pd.concat(frames, sort=False, copy=False)\
+            .reset_index(drop=True)
         laps.rename(columns={'TotalLaps': 'TyreLife',
                              'NumberOfPitStops': 'Stint',
                              'Driver': 'DriverNumber',
@@ -1297,6 +1302,11 @@ class Session:
 
         else:
             logging.warning("Could not load any valid session status information!")
+        # driver abbreviations and compound names are a handful of unique
+        # values repeated once per lap; as categorical data they are cheaper
+        # to store and faster to compare against in pick_driver/pick_tyre
+        laps['Driver'] = laps['Driver'].astype('category')
+        laps['Compound'] = laps['Compound'].astype('category')
         self._laps = Laps(laps, session=self)
         self._check_lap_accuracy()
 
@@ -26,18 +26,18 @@ LAP_DTYPES = {'Time': '<m8[ns]',
               'SpeedI2': 'float64',
               'SpeedFL': 'float64',
               'SpeedST': 'float64',
-              'Compound': 'O',
+              'Compound': 'category',
               'TyreLife': 'float64',
               'FreshTyre': 'O',
               'LapStartTime': '<m8[ns]',
               'Team': 'O',
-              'Driver': 'O',
+              'Driver': 'category',
               'TrackStatus': 'O',
               'IsAccurate': 'O'}
 
 CAR_DATA_DTYPES = {'Brake': 'bool',
                    'nGear': 'int64',
-                   'DRS': 'int64',
+                   'DRS': 'int8',
                    'Date': '<M8[ns]',
                    'Throttle': 'int64',
                    'RPM': 'int64',
@@ -91,7 +91,15 @@ def _test_cache_used_and_clear(tmpdir):
                              'session_status_data.ff1pkl',
                              'timing_app_data.ff1pkl', 'timing_data.ff1pkl',
                              'track_status_data.ff1pkl',
-                             'weather_data.ff1pkl']
+                             'weather_data.ff1pkl',
+                             # parsed raw responses cached by fetch_page
+                             'car_data_raw.ff1pkl', 'position_raw.ff1pkl',
+                             'driver_list_raw.ff1pkl',
+                             'session_status_raw.ff1pkl',
+                             'timing_app_data_raw.ff1pkl',
+                             'timing_data_raw.ff1pkl',
+                             'track_status_raw.ff1pkl',
+                             'weather_data_raw.ff1pkl']
         # test both ways round
         assert all(elem in expected_dir_list for elem in dir_list)
         assert all(elem in dir_list for elem in expected_dir_list)
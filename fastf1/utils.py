@@ -2,11 +2,14 @@
 Utils module - :mod:`fastf1.utils`
 ==================================
 """
-from functools import reduce
-
 import numpy as np
 from datetime import datetime, timedelta
 
+try:
+    import ciso8601  # C implementation; much faster on ISO-8601 strings
+except ImportError:
+    ciso8601 = None
+
 
 def delta_time(reference_lap, compare_lap):
     # TODO move somewhere else
@@ -88,13 +91,16 @@ def delta_time(reference_lap, compare_lap):
 
 def recursive_dict_get(d, *keys, default_none=False):
     """Recursive dict get. Can take an arbitrary number of keys and returns an empty
-    dict if any key does not exist.
-    https://stackoverflow.com/a/28225747"""
-    ret = reduce(lambda c, k: c.get(k, {}), keys, d)
-    if default_none and ret == {}:
+    dict if any key does not exist."""
+    # implemented as a plain loop; this is called for almost every response
+    # entry during parsing, where the per-call overhead of reduce plus a
+    # lambda adds up
+    for key in keys:
+        d = d.get(key, {})
+    if default_none and d == {}:
         return None
     else:
-        return ret
+        return d
 
 
 def to_timedelta(x):
@@ -167,6 +173,14 @@ def to_datetime(x):
         datetime.datetime
     """
     if isinstance(x, str):
+        if ciso8601 is not None:
+            try:
+                # naive parse so that the trailing 'Z' does not make the
+                # result timezone-aware
+                return ciso8601.parse_datetime_as_naive(x)
+            except ValueError:
+                pass  # unsupported format; use the manual parser below
+
         date, time = x.strip('Z').split('T')
         year, month, day = date.split('-')
         hours, minutes, seconds = time.split(':')